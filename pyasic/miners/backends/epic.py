@@ -14,10 +14,16 @@
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
 
-from typing import List, Optional
-
+import asyncio
+import functools
+import inspect
+import re
+import time
+from typing import List, Optional, Union
+
+from pyasic import settings
 from pyasic.config import MinerConfig
-from pyasic.data import Fan, HashBoard
+from pyasic.data import Fan, HashBoard, MinerData
 from pyasic.data.error_codes import MinerErrorData, X19Error
 from pyasic.errors import APIError
 from pyasic.logger import logger
@@ -25,54 +31,85 @@ from pyasic.miners.base import BaseMiner
 from pyasic.miners.data import DataFunction, DataLocations, DataOptions, WebAPICommand
 from pyasic.web.epic import ePICWebAPI
 
+# "ePIC v1.2.3" -> "1.2.3"
+FW_VER_RE = re.compile(r" v?(\S+)")
+
+
+def needs(*endpoints: str):
+    """Fill in any missing `web_{endpoint}` arguments of a getter.
+
+    Endpoints that were not passed in are fetched concurrently with
+    `ePIC._fetch()`, and are `None` if the request failed.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self: "ePIC", *args, **kwargs):
+            bound = signature.bind_partial(self, *args, **kwargs)
+            arguments = bound.arguments
+            missing = [ep for ep in endpoints if arguments.get(f"web_{ep}") is None]
+            if missing:
+                results = await asyncio.gather(*[self._fetch(ep) for ep in missing])
+                for ep, result in zip(missing, results):
+                    arguments[f"web_{ep}"] = result
+            return await func(*bound.args, **bound.kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+_WEB_SUMMARY = WebAPICommand("web_summary", "summary")
+_WEB_NETWORK = WebAPICommand("web_network", "network")
+_WEB_CAPABILITIES = WebAPICommand("web_capabilities", "capabilities")
+
 EPIC_DATA_LOC = DataLocations(
     **{
         str(DataOptions.MAC): DataFunction(
             "_get_mac",
-            [WebAPICommand("web_network", "network")],
+            [_WEB_NETWORK],
         ),
         str(DataOptions.FW_VERSION): DataFunction(
             "_get_fw_ver",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.HOSTNAME): DataFunction(
             "_get_hostname",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.HASHRATE): DataFunction(
             "_get_hashrate",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.EXPECTED_HASHRATE): DataFunction(
             "_get_expected_hashrate",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.HASHBOARDS): DataFunction(
             "_get_hashboards",
-            [
-                WebAPICommand("web_summary", "summary"),
-                WebAPICommand("web_capabilities", "capabilities"),
-            ],
+            [_WEB_SUMMARY, _WEB_CAPABILITIES],
         ),
         str(DataOptions.WATTAGE): DataFunction(
             "_get_wattage",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.FANS): DataFunction(
             "_get_fans",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.ERRORS): DataFunction(
             "_get_errors",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.FAULT_LIGHT): DataFunction(
             "_get_fault_light",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
         str(DataOptions.UPTIME): DataFunction(
             "_get_uptime",
-            [WebAPICommand("web_summary", "summary")],
+            [_WEB_SUMMARY],
         ),
     }
 )
@@ -90,10 +127,111 @@ class ePIC(BaseMiner):
 
     supports_shutdown = True
 
+    def __init__(self, ip: str) -> None:
+        super().__init__(ip)
+        # summary request shared between getters, see _fetch_summary()
+        self._summary_task: Optional[asyncio.Future] = None
+        self._summary_expires = 0.0
+        # number of get_data() calls currently running
+        self._polls = 0
+
+    async def get_data(
+        self,
+        allow_warning: bool = False,
+        include: List[Union[str, DataOptions]] = None,
+        exclude: List[Union[str, DataOptions]] = None,
+    ) -> MinerData:
+        """Get data from the miner in the form of [`MinerData`][pyasic.data.MinerData].
+
+        Behaves like [`get_data`][pyasic.miners.base.MinerProtocol.get_data], but the
+        web summary is requested once and shared by every data item in the call.
+
+        Parameters:
+            allow_warning: Allow warning when an API command fails.
+            include: Names of data items you want to gather. Defaults to all data.
+            exclude: Names of data items to exclude.  Exclusion happens after considering included items.
+
+        Returns:
+            A [`MinerData`][pyasic.data.MinerData] instance containing data from the miner.
+        """
+        if self._polls == 0:
+            # every poll starts from a fresh summary, however recent the last one
+            self._summary_task = None
+        self._polls += 1
+        try:
+            return await super().get_data(
+                allow_warning=allow_warning, include=include, exclude=exclude
+            )
+        finally:
+            self._polls -= 1
+            if self._polls == 0:
+                self._summary_task = None
+
+    async def _web_multicommand(self, *commands: str, allow_warning: bool) -> dict:
+        if "summary" not in commands:
+            return await super()._web_multicommand(
+                *commands, allow_warning=allow_warning
+            )
+        # route the summary through _fetch_summary(), so get_config() shares it
+        others = [cmd for cmd in commands if cmd != "summary"]
+        summary, data = await asyncio.gather(
+            self._fetch("summary"),
+            self.web.multicommand(*others, allow_warning=allow_warning),
+        )
+        data["summary"] = summary
+        return data
+
+    async def _fetch_summary(self) -> Optional[dict]:
+        """Get the web summary, sharing a single request between callers.
+
+        An in-flight request is always shared.  While `get_data()` is running
+        the result is kept until it finishes, so every getter in that poll
+        reuses the same response, and each poll starts with a new request.
+        Outside of `get_data()` a successful result is reused for
+        `epic_summary_cache_ttl` seconds, until a command changes the miner.
+        """
+        task = self._summary_task
+        if (
+            task is not None
+            and task.done()
+            and not self._polls
+            and time.monotonic() >= self._summary_expires
+        ):
+            task = self._summary_task = None
+        if task is None:
+            task = self._summary_task = asyncio.ensure_future(self.web.summary())
+            task.add_done_callback(self._summary_done)
+        return await asyncio.shield(task)
+
+    def _summary_done(self, task: asyncio.Future) -> None:
+        if self._summary_task is not task:
+            return
+        # send_command() returns None instead of raising when the miner is unreachable
+        if task.cancelled() or task.exception() is not None or not task.result():
+            # only a running poll keeps a failed request, so its getters don't retry
+            if not self._polls:
+                self._summary_task = None
+            return
+        self._summary_expires = time.monotonic() + settings.get(
+            "epic_summary_cache_ttl", 2
+        )
+
+    def _clear_summary(self) -> None:
+        # called after commands that change the miner state
+        self._summary_task = None
+
+    async def _fetch(self, endpoint: str) -> Optional[dict]:
+        try:
+            if endpoint == "summary":
+                return await self._fetch_summary()
+            return await getattr(self.web, endpoint)()
+        except APIError:
+            return None
+
     async def get_config(self) -> MinerConfig:
         summary = None
         try:
-            summary = await self.web.summary()
+            summary = await self._fetch_summary()
         except APIError as e:
             logger.warning(e)
         except LookupError:
@@ -131,9 +269,12 @@ class ePIC(BaseMiner):
             await self.web.set_pools(conf["pools"])
         except APIError:
             pass
+        finally:
+            self._clear_summary()
 
     async def restart_backend(self) -> bool:
         data = await self.web.restart_epic()
+        self._clear_summary()
         if data:
             try:
                 return data["success"]
@@ -143,6 +284,7 @@ class ePIC(BaseMiner):
 
     async def stop_mining(self) -> bool:
         data = await self.web.stop_mining()
+        self._clear_summary()
         if data:
             try:
                 return data["success"]
@@ -152,6 +294,7 @@ class ePIC(BaseMiner):
 
     async def resume_mining(self) -> bool:
         data = await self.web.resume_mining()
+        self._clear_summary()
         if data:
             try:
                 return data["success"]
@@ -161,6 +304,7 @@ class ePIC(BaseMiner):
 
     async def reboot(self) -> bool:
         data = await self.web.reboot()
+        self._clear_summary()
         if data:
             try:
                 return data["success"]
@@ -168,74 +312,44 @@ class ePIC(BaseMiner):
                 pass
         return False
 
+    @needs("network")
     async def _get_mac(self, web_network: dict = None) -> Optional[str]:
-        if web_network is None:
-            try:
-                web_network = await self.web.network()
-            except APIError:
-                pass
-
         if web_network is not None:
-            try:
-                for network in web_network:
-                    mac = web_network[network]["mac_address"]
-                    return mac
-            except KeyError:
-                pass
-
+            # first interface that reports a MAC address
+            return next(
+                (
+                    network["mac_address"]
+                    for network in web_network.values()
+                    if isinstance(network, dict) and network.get("mac_address")
+                ),
+                None,
+            )
+
+    @needs("summary")
     async def _get_hostname(self, web_summary: dict = None) -> Optional[str]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
-            try:
-                hostname = web_summary["Hostname"]
-                return hostname
-            except KeyError:
-                pass
+            return web_summary.get("Hostname")
 
+    @needs("summary")
     async def _get_wattage(self, web_summary: dict = None) -> Optional[int]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
-            try:
-                wattage = web_summary["Power Supply Stats"]["Input Power"]
-                wattage = round(wattage)
-                return wattage
-            except KeyError:
-                pass
+            wattage = (web_summary.get("Power Supply Stats") or {}).get("Input Power")
+            if wattage is not None:
+                return round(wattage)
 
+    @needs("summary")
     async def _get_hashrate(self, web_summary: dict = None) -> Optional[float]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
             try:
-                hashrate = 0
-                if web_summary["HBs"] is not None:
-                    for hb in web_summary["HBs"]:
-                        hashrate += hb["Hashrate"][0]
-                    return round(float(float(hashrate / 1000000)), 2)
+                hbs = web_summary["HBs"]
+                if hbs is not None:
+                    hashrate = sum(hb["Hashrate"][0] for hb in hbs)
+                    return round(hashrate / 1000000, 2)
             except (LookupError, ValueError, TypeError):
                 pass
 
+    @needs("summary")
     async def _get_expected_hashrate(self, web_summary: dict = None) -> Optional[float]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
             try:
                 hashrate = 0
@@ -247,119 +361,81 @@ class ePIC(BaseMiner):
                             ideal = hb["Hashrate"][1] / 100
 
                         hashrate += hb["Hashrate"][0] / ideal
-                    return round(float(float(hashrate / 1000000)), 2)
+                    return round(hashrate / 1000000, 2)
             except (LookupError, ValueError, TypeError):
                 pass
 
+    @needs("summary")
     async def _get_fw_ver(self, web_summary: dict = None) -> Optional[str]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
             try:
-                fw_ver = web_summary["Software"]
-                fw_ver = fw_ver.split(" ")[1].replace("v", "")
-                return fw_ver
-            except KeyError:
+                match = FW_VER_RE.search(web_summary["Software"])
+                if match is not None:
+                    return match.group(1)
+            except (KeyError, TypeError):
                 pass
 
+    @needs("summary")
     async def _get_fans(self, web_summary: dict = None) -> List[Fan]:
         if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
-        fans = []
+            return []
 
-        if web_summary is not None:
-            for fan in web_summary["Fans Rpm"]:
-                try:
-                    fans.append(Fan(web_summary["Fans Rpm"][fan]))
-                except (LookupError, ValueError, TypeError):
-                    fans.append(Fan())
-        return fans
+        fans_rpm = web_summary.get("Fans Rpm") or {}
+        return [
+            Fan(rpm) if isinstance(rpm, (int, float)) else Fan()
+            for rpm in fans_rpm.values()
+        ]
 
+    @needs("summary", "capabilities")
     async def _get_hashboards(
         self, web_summary: dict = None, web_capabilities: dict = None
     ) -> List[HashBoard]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
-        if web_capabilities is not None:
-            try:
-                web_capabilities = await self.web.capabilities()
-            except APIError:
-                pass
-
         hb_list = [
             HashBoard(slot=i, expected_chips=self.expected_chips)
             for i in range(self.expected_hashboards)
         ]
-        if web_summary.get("HBs") is not None:
-            for hb in web_summary["HBs"]:
+        if web_summary is None or web_summary.get("HBs") is None:
+            return hb_list
+
+        # the chip count is the same for every board, look it up once
+        num_of_chips = None
+        if web_capabilities is not None:
+            try:
                 num_of_chips = web_capabilities["Performance Estimator"]["Chip Count"]
-                hashrate = hb["Hashrate"][0]
-                # Update the Hashboard object
-                hb_list[hb["Index"]].missing = False
-                hb_list[hb["Index"]].hashrate = round(hashrate / 1000000, 2)
-                hb_list[hb["Index"]].chips = num_of_chips
-                hb_list[hb["Index"]].temp = hb["Temperature"]
+            except LookupError:
+                pass
+
+        for hb in web_summary["HBs"]:
+            board = hb_list[hb["Index"]]
+            # Update the Hashboard object
+            board.missing = False
+            board.hashrate = round(hb["Hashrate"][0] / 1000000, 2)
+            board.chips = num_of_chips
+            board.temp = hb["Temperature"]
         return hb_list
 
     async def _is_mining(self, *args, **kwargs) -> Optional[bool]:
         return None
 
+    @needs("summary")
     async def _get_uptime(self, web_summary: dict = None) -> Optional[int]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
-            try:
-                uptime = web_summary["Session"]["Uptime"]
-                return uptime
-            except KeyError:
-                pass
+            return (web_summary.get("Session") or {}).get("Uptime")
         return None
 
+    @needs("summary")
     async def _get_fault_light(self, web_summary: dict = None) -> Optional[bool]:
-        if web_summary is None:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         if web_summary is not None:
-            try:
-                light = web_summary["Misc"]["Locate Miner State"]
+            light = (web_summary.get("Misc") or {}).get("Locate Miner State")
+            if light is not None:
                 return light
-            except KeyError:
-                pass
         return False
 
+    @needs("summary")
     async def _get_errors(self, web_summary: dict = None) -> List[MinerErrorData]:
-        if not web_summary:
-            try:
-                web_summary = await self.web.summary()
-            except APIError:
-                pass
-
         errors = []
         if web_summary is not None:
-            try:
-                error = web_summary["Status"]["Last Error"]
-                if error is not None:
-                    errors.append(X19Error(str(error)))
-                return errors
-            except KeyError:
-                pass
+            error = (web_summary.get("Status") or {}).get("Last Error")
+            if error is not None:
+                errors.append(X19Error(str(error)))
         return errors
@@ -361,6 +361,9 @@ class MinerProtocol(Protocol):
     async def _get_uptime(self) -> Optional[int]:
         pass
 
+    async def _web_multicommand(self, *commands: str, allow_warning: bool) -> dict:
+        return await self.web.multicommand(*commands, allow_warning=allow_warning)
+
     async def _get_data(
         self,
         allow_warning: bool,
@@ -401,7 +404,7 @@ class MinerProtocol(Protocol):
             api_command_task = asyncio.sleep(0)
         if len(web_multicommand) > 0:
             web_command_task = asyncio.create_task(
-                self.web.multicommand(*web_multicommand, allow_warning=allow_warning)
+                self._web_multicommand(*web_multicommand, allow_warning=allow_warning)
             )
         else:
             web_command_task = asyncio.sleep(0)
@@ -418,7 +421,8 @@ class MinerProtocol(Protocol):
 
         for data_name in include:
             try:
-                fn_args = getattr(self.data_locations, data_name).kwargs
+                data_function = getattr(self.data_locations, data_name)
+                fn_args = data_function.kwargs
                 args_to_send = {k.name: None for k in fn_args}
                 for arg in fn_args:
                     try:
@@ -439,7 +443,7 @@ class MinerProtocol(Protocol):
             except LookupError:
                 continue
             try:
-                function = getattr(self, getattr(self.data_locations, data_name).cmd)
+                function = getattr(self, data_function.cmd)
                 miner_data[data_name] = await function(**args_to_send)
             except Exception as e:
                 raise APIError(
@@ -473,10 +477,6 @@ class MinerProtocol(Protocol):
                 else 0
             ),
             expected_hashboards=self.expected_hashboards,
-            hashboards=[
-                HashBoard(slot=i, expected_chips=self.expected_chips)
-                for i in range(self.expected_hashboards)
-            ],
         )
 
         gathered_data = await self._get_data(
@@ -486,6 +486,13 @@ class MinerProtocol(Protocol):
             if gathered_data[item] is not None:
                 setattr(data, item, gathered_data[item])
 
+        # only build the placeholder boards if the miner didn't return any
+        if gathered_data.get("hashboards") is None:
+            data.hashboards = [
+                HashBoard(slot=i, expected_chips=self.expected_chips)
+                for i in range(self.expected_hashboards)
+            ]
+
         return data
 
 
@@ -40,6 +40,7 @@ _settings = {  # defaults
     "default_antminer_ssh_password": "miner",
     "default_bosminer_ssh_password": "root",
     "socket_linger_time": 1000,
+    "epic_summary_cache_ttl": 2,
 }
 
 
@@ -15,11 +15,18 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
 import httpx
 
+try:
+    # orjson parses the large summary and hashrate responses much faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from pyasic import settings
 from pyasic.errors import APIError
 from pyasic.web.base import BaseWebAPI
@@ -40,49 +47,77 @@ class ePICWebAPI(BaseWebAPI):
         allow_warning: bool = True,
         privileged: bool = False,
         **parameters: Any,
+    ) -> dict:
+        async with httpx.AsyncClient(transport=settings.transport()) as client:
+            return await self._send_command(
+                client,
+                command,
+                ignore_errors=ignore_errors,
+                privileged=privileged,
+                **parameters,
+            )
+
+    async def _send_command(
+        self,
+        client: httpx.AsyncClient,
+        command: str | bytes,
+        ignore_errors: bool = False,
+        privileged: bool = False,
+        **parameters: Any,
     ) -> dict:
         post = privileged or not parameters == {}
 
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
-            try:
-                if post:
-                    response = await client.post(
-                        f"http://{self.ip}:{self.port}/{command}",
-                        timeout=5,
-                        json={
-                            **parameters,
-                            "password": self.pwd,
-                        },
-                    )
-                else:
-                    response = await client.get(
-                        f"http://{self.ip}:{self.port}/{command}",
-                        timeout=5,
+        try:
+            if post:
+                response = await client.post(
+                    f"http://{self.ip}:{self.port}/{command}",
+                    timeout=5,
+                    json={
+                        **parameters,
+                        "password": self.pwd,
+                    },
+                )
+            else:
+                response = await client.get(
+                    f"http://{self.ip}:{self.port}/{command}",
+                    timeout=5,
+                )
+            if not response.status_code == 200:
+                if not ignore_errors:
+                    raise APIError(
+                        f"Web command {command} failed with status code {response.status_code}"
                     )
-                if not response.status_code == 200:
+                return {}
+            json_data = json_loads(response.content)
+            if json_data:
+                # The API can return a fail status if the miner cannot return the requested data. Catch this and pass
+                if not json_data.get("result", True) and not post:
                     if not ignore_errors:
-                        raise APIError(
-                            f"Web command {command} failed with status code {response.status_code}"
-                        )
-                    return {}
-                json_data = response.json()
-                if json_data:
-                    # The API can return a fail status if the miner cannot return the requested data. Catch this and pass
-                    if not json_data.get("result", True) and not post:
-                        if not ignore_errors:
-                            raise APIError(json_data["error"])
-                    return json_data
-                return {"success": True}
-            except (httpx.HTTPError, json.JSONDecodeError, AttributeError):
-                pass
+                        raise APIError(json_data["error"])
+                return json_data
+            return {"success": True}
+        except (httpx.HTTPError, json.JSONDecodeError, AttributeError):
+            pass
 
     async def multicommand(
         self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
     ) -> dict:
+        tasks = {}
+        # send all commands concurrently over one client, so they share its
+        # connections, total time is the slowest command
+        async with httpx.AsyncClient(transport=settings.transport()) as client:
+            for cmd in commands:
+                tasks[cmd] = asyncio.create_task(self._send_command(client, cmd))
+
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
         data = {k: None for k in commands}
         data["multicommand"] = True
-        for command in commands:
-            data[command] = await self.send_command(command)
+        for cmd in tasks:
+            try:
+                data[cmd] = tasks[cmd].result()
+            except APIError:
+                pass
         return data
 
     async def restart_epic(self) -> dict:
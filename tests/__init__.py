@@ -17,6 +17,7 @@
 from tests.api_tests import *
 from tests.config_tests import TestConfig
 from tests.miners_tests import MinersTest
+from tests.miners_tests.test_epic import ePICTest, ePICWebAPITest
 from tests.network_tests import NetworkTest
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import json
+import time
+import unittest
+import warnings
+from collections import Counter
+
+from pyasic.miners.backends.epic import ePIC
+from pyasic.web.epic import ePICWebAPI
+
+
+def epic_summary(hostname: str = "epic", pool: str = "stratum+tcp://pool:3333"):
+    return {
+        "Hostname": hostname,
+        "Software": "ePIC v1.2.3",
+        "Session": {"Uptime": 100},
+        "Misc": {"Locate Miner State": False, "Shutdown Temp": 90},
+        "Status": {"Last Error": None},
+        "Fans Rpm": {"Fans Speed": 3000},
+        "Power Supply Stats": {"Input Power": 3000.0},
+        "HBs": [{"Index": 0, "Hashrate": [1000000, 100], "Temperature": 50}],
+        "StratumConfigs": [{"pool": pool, "login": "user", "password": "x"}],
+        "Fans": {"Fan Mode": {"Auto": {"Target Temperature": 60}}},
+        "PerpetualTune": {"Running": False},
+    }
+
+
+class ePICTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        warnings.filterwarnings("ignore")
+        self.miner = ePIC("127.0.0.1")
+        self.calls = Counter()
+        self.responses = {
+            "summary": epic_summary(),
+            "network": {"eth0": {"mac_address": "00:11:22:33:44:55"}},
+            "capabilities": {"Performance Estimator": {"Chip Count": 108}},
+        }
+
+        async def send_command(client, command, *args, **kwargs):
+            self.calls[command] += 1
+            await asyncio.sleep(0)
+            return self.responses.get(command)
+
+        self.miner.web._send_command = send_command
+
+    async def test_get_data_sends_one_summary(self):
+        data = await self.miner.get_data()
+        self.assertEqual(self.calls, Counter(summary=1, network=1, capabilities=1))
+        self.assertEqual(data.hostname, "epic")
+        self.assertEqual(data.mac, "00:11:22:33:44:55")
+
+    async def test_overlapping_get_data(self):
+        first, second = await asyncio.gather(
+            self.miner.get_data(), self.miner.get_data()
+        )
+        self.assertEqual(first.hostname, "epic")
+        self.assertEqual(second.hostname, "epic")
+        self.assertEqual(self.miner._polls, 0)
+        self.assertIsNone(self.miner._summary_task)
+
+    async def test_concurrent_getters_share_summary(self):
+        await asyncio.gather(
+            self.miner.get_hostname(),
+            self.miner.get_uptime(),
+            self.miner.get_fw_ver(),
+        )
+        self.assertEqual(self.calls["summary"], 1)
+
+    async def test_get_hashboards_without_arguments(self):
+        boards = await self.miner._get_hashboards()
+        self.assertEqual(self.calls["capabilities"], 1)
+        self.assertFalse(boards[0].missing)
+        self.assertEqual(boards[0].chips, 108)
+        self.assertEqual(boards[0].hashrate, 1.0)
+        self.assertTrue(boards[1].missing)
+
+    async def test_get_hashboards_without_summary(self):
+        self.responses["summary"] = None
+        boards = await self.miner._get_hashboards()
+        self.assertEqual(len(boards), self.miner.expected_hashboards)
+        self.assertTrue(all(board.missing for board in boards))
+
+    async def test_getters_accept_positional_arguments(self):
+        summary = epic_summary(hostname="positional")
+        self.assertEqual(await self.miner._get_hostname(summary), "positional")
+        boards = await self.miner._get_hashboards(
+            summary, {"Performance Estimator": {"Chip Count": 12}}
+        )
+        self.assertEqual(boards[0].chips, 12)
+        self.assertEqual(sum(self.calls.values()), 0)
+
+    async def test_get_config_returns_independent_configs(self):
+        first = await self.miner.get_config()
+        first.temperature.hot = 12345
+        second = await self.miner.get_config()
+        self.assertIsNot(first, second)
+        self.assertIsNone(second.temperature.hot)
+
+    async def test_summary_reused_between_direct_calls(self):
+        await self.miner.get_hostname()
+        await self.miner.get_uptime()
+        self.assertEqual(self.calls["summary"], 1)
+
+    async def test_failed_summary_not_cached(self):
+        self.responses["summary"] = None
+        self.assertIsNone(await self.miner.get_hostname())
+        self.assertIsNone(await self.miner.get_hostname())
+        self.assertEqual(self.calls["summary"], 2)
+
+    async def test_get_data_does_not_reuse_direct_summary(self):
+        self.responses["summary"] = epic_summary("poll1", "stratum+tcp://poll1:3333")
+        await self.miner.get_hostname()
+        self.responses["summary"] = epic_summary("poll2", "stratum+tcp://poll2:3333")
+        data = await self.miner.get_data()
+        self.assertEqual(data.hostname, "poll2")
+        self.assertEqual(
+            data.config.pools.groups[0].pools[0].url, "stratum+tcp://poll2:3333"
+        )
+
+    async def test_commands_clear_summary(self):
+        self.responses["summary"] = epic_summary("before")
+        await self.miner.get_hostname()
+        self.responses["summary"] = epic_summary("after")
+        await self.miner.stop_mining()
+        self.assertEqual(await self.miner.get_hostname(), "after")
+
+
+class ePICWebAPITest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        warnings.filterwarnings("ignore")
+        self.open_connections = 0
+
+        async def handle(reader, writer):
+            self.open_connections += 1
+            try:
+                while True:
+                    request = await reader.readuntil(b"\r\n\r\n")
+                    path = request.split(b" ")[1].decode()
+                    if path == "/summary":
+                        # a miner that accepts the connection but never answers
+                        await asyncio.sleep(10)
+                    body = json.dumps({"path": path}).encode()
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                        + body
+                    )
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                self.open_connections -= 1
+                writer.close()
+
+        self.server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+
+    def web(self) -> ePICWebAPI:
+        web = ePICWebAPI("127.0.0.1")
+        web.port = self.port
+        return web
+
+    async def test_hung_miners_do_not_starve_others(self):
+        hung = [asyncio.create_task(self.web().summary()) for _ in range(300)]
+        await asyncio.sleep(0.5)
+        start = time.monotonic()
+        results = await asyncio.gather(*[self.web().network() for _ in range(50)])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(results, [{"path": "/network"}] * 50)
+        for task in hung:
+            task.cancel()
+        await asyncio.gather(*hung, return_exceptions=True)
+
+    async def test_multicommand(self):
+        data = await self.web().multicommand("network", "capabilities")
+        self.assertEqual(data["network"], {"path": "/network"})
+        self.assertEqual(data["capabilities"], {"path": "/capabilities"})
+
+    async def test_connections_closed_after_command(self):
+        await self.web().network()
+        await self.web().multicommand("network", "capabilities")
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.open_connections, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()